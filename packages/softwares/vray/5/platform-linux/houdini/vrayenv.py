@@ -3,18 +3,23 @@ def commands(env, root):
     #env.HFS = "/opt/hfs.18.5.759/"
     #env.HOUDINI_USER_PREF_DIR = "/opt/hfs.18.5.759/packages"
     
-    env.VFH_ROOT="/opt/vray_adv_52002_houdini18.5.759"
+    vfh_root = "/opt/vray_adv_52002_houdini18.5.759"
+    vray_appsdk = f"{vfh_root}/appsdk"
+    aura_loaders = f"{vfh_root}/vfh_home/libs"
+    vfh_houdini_path = f"{vfh_root}/vfh_home"
+    # rez has no extend(), build the whole list once instead of appending
+    vfh_path = ":".join([f"{vfh_root}/bin", f"{vray_appsdk}/bin", aura_loaders])
 
-    env.VRAY_APPSDK=f"{env.VFH_ROOT}/appsdk"
-    env.VRAY_UI_DS_PATH=f"{env.VFH_ROOT}/ui"
-    env.VRAY_FOR_HOUDINI_AURA_LOADERS=f"{env.VFH_ROOT}/vfh_home/libs"
-    env.VFH_PATH=f"{env.VFH_ROOT}/bin"
-    env.VFH_PATH.append(f"{env.VRAY_APPSDK}/bin")
-    env.VFH_PATH.append(f"{env.VRAY_FOR_HOUDINI_AURA_LOADERS}")
-    env.VFH_HOUDINI_PATH=f"{env.VFH_ROOT}/vfh_home"
+    env.VFH_ROOT = vfh_root
 
-    env.PATH.append(f"{env.VFH_PATH}")
-    env.HOUDINI_PATH.prepend(f"{env.VFH_HOUDINI_PATH}")
+    env.VRAY_APPSDK = vray_appsdk
+    env.VRAY_UI_DS_PATH = f"{vfh_root}/ui"
+    env.VRAY_FOR_HOUDINI_AURA_LOADERS = aura_loaders
+    env.VFH_PATH = vfh_path
+    env.VFH_HOUDINI_PATH = vfh_houdini_path
+
+    env.PATH.append(vfh_path)
+    env.HOUDINI_PATH.prepend(vfh_houdini_path)
     
     return
     # Path pointing to QT platform plugins so V-Ray can load dependencies.
@@ -1,15 +1,18 @@
 def commands(env, root):    
-    env.VFH_ROOT="/opt/vray_adv_52002_houdini18.5.759"
+    vfh_root = "/opt/vray_adv_52002_houdini18.5.759"
+    vray_appsdk = f"{vfh_root}/appsdk"
 
-    env.VRAY_APPSDK=f"{env.VFH_ROOT}/appsdk"
-    env.VRAY_UI_DS_PATH=f"{env.VFH_ROOT}/ui"
-    env.VFH_HOME.append(f"{env.VFH_ROOT}/vfh_home")
+    env.VFH_ROOT = vfh_root
 
-    env.PATH.append(f"{env.VRAY_APPSDK}/bin")
+    env.VRAY_APPSDK = vray_appsdk
+    env.VRAY_UI_DS_PATH = f"{vfh_root}/ui"
+    env.VFH_HOME.append(f"{vfh_root}/vfh_home")
+
+    env.PATH.append(f"{vray_appsdk}/bin")
     env.PATH.append(f"{env.VFH_HOME}/bin")
-    env.PATH.append(f"/usr/ChaosGroup/V-Ray/Standalone_for_centos6/bin")
+    env.PATH.append("/usr/ChaosGroup/V-Ray/Standalone_for_centos6/bin")
 
-    env.VFH_PATH.append(f"{env.VRAY_APPSDK}/bin")
+    env.VFH_PATH.append(f"{vray_appsdk}/bin")
 
-    env.PYTHONPATH.append(f"{env.VRAY_APPSDK}/python37")
+    env.PYTHONPATH.append(f"{vray_appsdk}/python37")
     
\ No newline at end of file
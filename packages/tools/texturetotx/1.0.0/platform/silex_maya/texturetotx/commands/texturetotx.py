@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 # Forward references
 if typing.TYPE_CHECKING:
@@ -15,6 +15,7 @@ from silex_client.action.command_base import CommandBase
 from silex_client.utils import command_builder
 from silex_client.utils import files
 
+import functools
 import subprocess
 import logging
 import os
@@ -23,6 +24,28 @@ from pathlib import Path
 
 from maya import cmds
 
+# maketx already uses every core on its own, a few at once only overlaps the
+# file reads and writes. More would multiply the threads and the textures held
+# in memory in the artist's session
+MAX_MAKETX_PROCESSES = 4
+
+
+@functools.lru_cache(maxsize=4096)
+def _expand_path(file_path: Path) -> Dict[str, str]:
+    # UDIM tiles and repeated nodes resolve the same path several times
+    return files.expand_path(file_path)
+
+
+@functools.lru_cache(maxsize=4096)
+def _maketx_argv(input_file: str, out_file: str) -> Tuple[str, ...]:
+    # Reruns of the action convert the same files, build their command once
+    batch_cmd = (
+        command_builder.CommandBuilder("maketx", delimiter=None)
+        .param("o", out_file)
+        .value(input_file)
+    )
+    return tuple(batch_cmd.as_argv())
+
 
 class TextureToTx(CommandBase):
     """
@@ -61,20 +84,29 @@ class TextureToTx(CommandBase):
         """
         Return texturepath for each maya node file
         """
+        color_spaces = await execute_in_main_thread(
+            self.get_color_spaces, [obj["attr"] for obj in file_nodes_paths]
+        )
         return [
-            { 
+            {
                 "paths": obj["paths"],
                 "attr": obj["attr"],
-                "aces": cmds.getAttr(f"{obj['attr']}.colorSpace")
+                "aces": aces,
             }
-            for obj in file_nodes_paths
+            for obj, aces in zip(file_nodes_paths, color_spaces)
         ]
 
+    def get_color_spaces(self, nodes: List[str]) -> List[str]:
+        """
+        Query the colorSpace of every file node in a single main thread call
+        """
+        return [cmds.getAttr(f"{node}.colorSpace") for node in nodes]
+
     def get_expand_path(self, file_path: Path) -> Dict[str, str]:
         """
         return expand_path from utils
         """
-        return files.expand_path(file_path)
+        return _expand_path(file_path)
 
     def get_version_path(self, file_path: Path, logger):
         """
@@ -84,16 +116,20 @@ class TextureToTx(CommandBase):
         ext = file_path.suffix
         ext = ext.replace(".", "")
         expand_path = self.get_expand_path(file_path)
-        logger.error(file_path)
-        logger.error(expand_path)
+        logger.debug("File path: %s", file_path)
+        logger.debug("Expanded path: %s", expand_path)
 
         ext = expand_path["OutputType"]
-        version_path = file_path.parent
+        parts = file_path.parts
 
-        while len(version_path.parents) > 1 and ext not in version_path.stem:
-            version_path = version_path.parent
+        # Walk the folder names up from the file instead of building a Path per level,
+        # the first folder is never checked, nor the drive/root when there is one
+        stop = 1 if file_path.anchor else 0
+        for index in range(len(parts) - 2, stop, -1):
+            if ext in os.path.splitext(parts[index])[0]:
+                return Path(*parts[:index])
 
-        return version_path.parent
+        return file_path.parents[-1]
 
     def set_texture_attribute(self, attribute: str, node: str, value: str):
         """
@@ -101,18 +137,19 @@ class TextureToTx(CommandBase):
         """
         cmds.setAttr(f"{node}.{attribute}", value, type="string")
 
-    async def exec_make_tx(self, input_file: str, out_file: str, attr, aces):
+    async def exec_make_tx(
+        self, input_file: str, out_file: str, attr, aces, logger: logging.Logger
+    ):
         """
         Launch the maketx process to convert tx in background
         """
-        batch_cmd = (
-            command_builder.CommandBuilder("maketx", delimiter=None)
-            .param("o", out_file)
-            .value(input_file)
-        )
-        await thread_client.execute_in_thread(
-            subprocess.call, batch_cmd.as_argv(), shell=True
-        )
+        argv = list(_maketx_argv(input_file, str(out_file)))
+        try:
+            await thread_client.execute_in_thread(subprocess.call, argv)
+        except OSError as exception:
+            # Without a shell a missing maketx raises instead of failing the command
+            logger.error("Could not run maketx on %s: %s", input_file, exception)
+            return
 
         # test if export completed and set texture data
         if os.path.isfile(out_file):
@@ -138,6 +175,11 @@ class TextureToTx(CommandBase):
 
         
         execution_task = []
+        semaphore = asyncio.Semaphore(MAX_MAKETX_PROCESSES)
+
+        async def make_tx(*args):
+            async with semaphore:
+                await self.exec_make_tx(*args)
 
         attr = file_nodes_paths["attributes"]
         path = file_nodes_paths["file_paths"]
@@ -152,57 +194,55 @@ class TextureToTx(CommandBase):
         ]
 
 
-        file_paths = [p["paths"] for p in file_nodes_paths]
-        file_paths = [str(p) for pl in file_paths for p in pl]
-        logger.error(file_paths)
+        file_paths = [str(p) for obj in file_nodes_paths for p in obj["paths"]]
+        logger.debug("Files to convert: %s", file_paths)
 
         if len(file_paths) > 0:
             await self.prompt_filepath(file_paths, action_query)
 
         # fill with aces
-        logger.error(file_nodes_paths)
+        logger.debug("File nodes: %s", file_nodes_paths)
         file_nodes_paths = await self.get_aces_file_path(file_nodes_paths)
-        logger.error(file_nodes_paths)
+        logger.debug("File nodes with color space: %s", file_nodes_paths)
 
         # prompt path files
         for temp_object in file_nodes_paths:
             paths = temp_object["paths"]
             attr = temp_object["attr"]
             aces = temp_object["aces"]
-            logger.error(paths)
-            logger.error(attr)
-            logger.error(aces)
+            logger.debug("Node paths: %s", paths)
+            logger.debug("Node: %s", attr)
+            logger.debug("Color space: %s", aces)
             for path in paths:
                 
                 expand_path = self.get_expand_path(path)
-                logger.error(expand_path)
+                logger.debug("Expanded path: %s", expand_path)
 
                 out_file_name = path.with_suffix(".tx")
                 
-                logger.error(path)
+                logger.debug("Converting: %s", path)
                 if files.is_valid_pipeline_path(path):
                     version_path = self.get_version_path(path, logger)
                     final_path = version_path / "tx" / expand_path["Name"] / out_file_name
                 else:
                     final_path = path.parent / out_file_name.name
 
-                logger.error(final_path)
-                logger.error(os.path.isfile(final_path))
+                logger.debug("Output path: %s", final_path)
 
                 # create out dir if not exist
-                if not os.path.exists(final_path.parent):
-                    os.makedirs(final_path.parent)
+                os.makedirs(final_path.parent, exist_ok=True)
 
-                # If keep existing and tx already exist
-                if not os.path.isfile(final_path) or not keep_existing_tx:
+                # If keep existing and tx already exist, only stat when it matters
+                if not keep_existing_tx or not os.path.isfile(final_path):
                     # exec maektx
-                    task = asyncio.create_task(self.exec_make_tx(str(path), final_path, attr, aces))
-                    execution_task.append(task)
-                    
-                if len(execution_task) > 10:
-                    await asyncio.gather(*execution_task)
-                    execution_task = []
+                    execution_task.append(
+                        make_tx(str(path), final_path, attr, aces, logger)
+                    )
                 break
-        # empty other objects
-        await asyncio.gather(*execution_task)
+
+        # Let every conversion finish even if one fails, then report the failures
+        results = await asyncio.gather(*execution_task, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Texture conversion failed: %s", result)
         
\ No newline at end of file
@@ -1,11 +1,14 @@
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
-from fileseq import FrameSet, findSequencesOnDisk
+from fileseq import FrameSet, findSequencesInList
 
 FILE_SIZE_THRESHOLD = 10000
+# The work is bound by the file server latency, not the CPU
+MAX_WORKERS = 32
 
 
 def parse_args() -> Tuple[Path, FrameSet]:
@@ -19,32 +22,64 @@ def parse_args() -> Tuple[Path, FrameSet]:
     return Path(args.folder), FrameSet(args.frange)
 
 
+def clear_frame(file: os.DirEntry) -> Optional[int]:
+    """
+    Delete the file if it is under the threshold, return its size when deleted
+    """
+    try:
+        # On windows the stat comes from the directory listing, no extra call
+        size = file.stat().st_size
+    except OSError:
+        # print(f"INFO: The file {file.path} does not exists")
+        return None
+
+    try:
+        if size < FILE_SIZE_THRESHOLD:
+            os.remove(file.path)
+            return size
+        else:
+            # print(f"INFO: Skipping the file {file.path} of {size/1000}kb")
+            pass
+    except Exception:
+        pass
+
+    return None
+
+
 def clear_frames(folder: Path, frange: FrameSet):
     if not folder.exists():
         print(f"INFO: The folder {folder} does not exists")
         return
 
-    sequences = findSequencesOnDisk(folder.as_posix())
-
-    for sequence in [s for s in sequences if len(s) > 1]:
-        for index in [f for f in frange if isinstance(f, int)]:
-            file = Path(sequence.frame(index))
-            if not file.exists():
-                # print(f"INFO: The file {file} does not exists")
-                continue
-
-            try:
-                size = os.path.getsize(file)
-                if size < FILE_SIZE_THRESHOLD:
-                    os.remove(file)
-                    print(
-                        f"[CLEAN EMPTY FRAMES]: The file {file} of {size/1000}kb has been deleted"
-                    )
-                else:
-                    # print(f"INFO: Skipping the file {file} of {size/1000}kb")
-                    pass
-            except Exception:
-                pass
+    # List the folder once, the entries are used to find the sequences
+    # and to know which frames exist without touching the disk again.
+    # Everything is keyed by file name, on windows entry.path mixes separators
+    # and fileseq would rebuild the frame paths with a different one
+    with os.scandir(folder.as_posix()) as scan:
+        entries = {
+            entry.name: entry
+            for entry in scan
+            if not entry.name.startswith(".") and entry.is_file()
+        }
+
+    sequences = findSequencesInList(list(entries))
+    frames = [f for f in frange if isinstance(f, int)]
+
+    frame_names = (
+        os.path.basename(sequence.frame(index))
+        for sequence in sequences
+        if len(sequence) > 1
+        for index in frames
+    )
+    files = [entries[name] for name in frame_names if name in entries]
+
+    # Keep several stat/remove in flight instead of waiting on each one
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for file, size in zip(files, executor.map(clear_frame, files)):
+            if size is not None:
+                print(
+                    f"[CLEAN EMPTY FRAMES]: The file {Path(file.path)} of {size/1000}kb has been deleted"
+                )
 
 
 def main():
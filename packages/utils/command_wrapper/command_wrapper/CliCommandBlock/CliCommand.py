@@ -46,4 +46,7 @@ class CliCommand():
         self.args = args
     
     def as_command_string(self):
-        return " ".join([self.command] + self.args)
\ No newline at end of file
+        return " ".join([self.command] + self.args)
+
+    def as_command_list(self):
+        return [self.command] + self.args
\ No newline at end of file
@@ -1,5 +1,5 @@
+import shutil
 import subprocess
-import time
 
 from .CliCommand import CliCommand
 from .CliCommandBlock import CliCommandBlock
@@ -34,13 +34,29 @@ class CliCommandBlockExecuter:
         return self.error
 
     def execute_single_command(self, command: CliCommand):
-        # add shell=True parameter is command should be executed in a shell
-        process = subprocess.Popen(command.as_command_string(), shell=True)
-
-        while process.poll() == None:
-            time.sleep(0.5)
+        # Empty commands (--pre "" or a trailing comma) have nothing to run
+        if not command.command:
+            return
+
+        # Spawn the command directly, shell builtins must be called through
+        # their shell explicitly (cmd /c, sh -c)
+        commandList = command.as_command_list()
+
+        # Resolve the executable ourselves: without a shell, windows only
+        # looks for .exe and would miss the .bat wrappers on the PATH
+        executable = shutil.which(command.command)
+        if executable is not None:
+            commandList[0] = executable
+
+        try:
+            process = subprocess.Popen(commandList)
+        except OSError as exception:
+            # Same as a failing command, the cleanups must still run
+            print(f"ERROR: Could not run {command.as_command_string()}: {exception}")
+            self.error = True
+            return
 
-        statusCode = process.returncode
+        statusCode = process.wait()
 
         if statusCode != 0:
             self.error = True
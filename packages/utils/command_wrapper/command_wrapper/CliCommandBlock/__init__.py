@@ -1,36 +1,44 @@
 import sys
-from typing import List
+from typing import List, Union
 
 from .CliCommand import CliCommand
 from .CliCommandBlock import CliCommandBlock
 from .CliCommandBlockExecuter import CliCommandBlockExecuter
 
 
+def build_command(command: Union[str, List[str]]) -> CliCommand:
+    """Build a command from a string, or from an already split list of args
+    which skips parsing it again with shlex
+    """
+    if isinstance(command, str):
+        return CliCommand.build_from_string(command)
+
+    return CliCommand.build_from_list(list(command))
+
+
 def wrap(
-    precommands: List[str] = [],
-    command: str = "",
-    postcommands: List[str] = [],
-    cleanups: List[str] = [],
+    precommands: List[Union[str, List[str]]] = [],
+    command: Union[str, List[str]] = "",
+    postcommands: List[Union[str, List[str]]] = [],
+    cleanups: List[Union[str, List[str]]] = [],
 ):
 
     commandBlock: CliCommandBlock = CliCommandBlock()
 
     if len(precommands) > 0:
         for commandString in precommands:
-            commandBlock.add_pre_command(CliCommand.build_from_string(commandString))
+            commandBlock.add_pre_command(build_command(commandString))
 
     if command:
-        commandBlock.set_command(CliCommand.build_from_string(command))
+        commandBlock.set_command(build_command(command))
 
     if len(postcommands) > 0:
         for commandString in postcommands:
-            commandBlock.add_post_command(CliCommand.build_from_string(commandString))
+            commandBlock.add_post_command(build_command(commandString))
 
     if len(cleanups) > 0:
         for commandString in cleanups:
-            commandBlock.add_cleanup_command(
-                CliCommand.build_from_string(commandString)
-            )
+            commandBlock.add_cleanup_command(build_command(commandString))
 
     cmd = CliCommandBlockExecuter(commandBlock)
 